@@ -1,5 +1,8 @@
 """Health check endpoints."""
 
+import asyncio
+import time
+
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 from sqlalchemy import text
@@ -10,6 +13,14 @@ from app.database import get_db
 
 router = APIRouter()
 
+# Seconds a database ping result is reused by the readiness check, so frequent
+# probes do not each cost a round-trip. A status change (outage or recovery)
+# can therefore take up to this long to show up in /health/ready.
+READINESS_TTL_SECONDS = 2.0
+
+_last_db_check: tuple[float, str] = (float("-inf"), "unknown")
+_db_check_lock = asyncio.Lock()
+
 
 class HealthResponse(BaseModel):
     """Health check response."""
@@ -24,6 +35,28 @@ class HealthDetailResponse(HealthResponse):
     database: str
 
 
+async def _cached_db_status(db: AsyncSession) -> str:
+    """Return the database status, pinging at most once per TTL."""
+    global _last_db_check
+
+    if time.monotonic() - _last_db_check[0] < READINESS_TTL_SECONDS:
+        return _last_db_check[1]
+
+    async with _db_check_lock:
+        # Another request may have refreshed the status while we waited.
+        if time.monotonic() - _last_db_check[0] < READINESS_TTL_SECONDS:
+            return _last_db_check[1]
+
+        try:
+            await db.execute(text("SELECT 1"))
+            db_status = "connected"
+        except Exception:
+            db_status = "disconnected"
+
+        _last_db_check = (time.monotonic(), db_status)
+        return db_status
+
+
 @router.get("/health", response_model=HealthResponse)
 async def health_check() -> HealthResponse:
     """Basic health check."""
@@ -32,12 +65,8 @@ async def health_check() -> HealthResponse:
 
 @router.get("/health/ready", response_model=HealthDetailResponse)
 async def readiness_check(db: AsyncSession = Depends(get_db)) -> HealthDetailResponse:
-    """Readiness check including database connectivity."""
-    try:
-        await db.execute(text("SELECT 1"))
-        db_status = "connected"
-    except Exception:
-        db_status = "disconnected"
+    """Readiness check including recently cached database connectivity."""
+    db_status = await _cached_db_status(db)
 
     return HealthDetailResponse(
         status="ok" if db_status == "connected" else "degraded",
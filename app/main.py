@@ -1,6 +1,7 @@
 """FastAPI application entry point."""
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from app import __version__
 from app.api import health
@@ -9,6 +10,7 @@ app = FastAPI(
     title="Transportation AI OS",
     description="Transportation Engineering AI SaaS Platform",
     version=__version__,
+    default_response_class=ORJSONResponse,
 )
 
 app.include_router(health.router, tags=["health"])
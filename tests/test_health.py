@@ -1,8 +1,14 @@
 """Health endpoint tests."""
 
+import asyncio
+import time
+
 import pytest
 
 from app import __version__
+from app.api import health
+from app.database import get_db
+from app.main import app
 
 
 @pytest.mark.asyncio
@@ -13,3 +19,102 @@ async def test_health_check(client):
     data = response.json()
     assert data["status"] == "ok"
     assert data["version"] == __version__
+
+
+class _FakeSession:
+    """Session stand-in that counts executed statements."""
+
+    def __init__(self, fail: bool = False):
+        self.calls = 0
+        self.fail = fail
+
+    async def execute(self, statement):
+        self.calls += 1
+        await asyncio.sleep(0)
+        if self.fail:
+            raise ConnectionError("database unavailable")
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    """Route readiness checks to a fake session with an empty status cache."""
+    session = _FakeSession()
+
+    async def override_get_db():
+        yield session
+
+    monkeypatch.setattr(health, "_last_db_check", (float("-inf"), "unknown"))
+    # Each test runs on its own event loop, so give it a fresh lock.
+    monkeypatch.setattr(health, "_db_check_lock", asyncio.Lock())
+    app.dependency_overrides[get_db] = override_get_db
+    yield session
+    app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.mark.asyncio
+async def test_readiness_check_caches_db_status(client, fake_session):
+    """Test that repeated readiness checks reuse a recent database ping."""
+    first = await client.get("/health/ready")
+    second = await client.get("/health/ready")
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert first.json()["database"] == "connected"
+    assert second.json()["status"] == "ok"
+    assert fake_session.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_readiness_check_pings_again_after_ttl(client, fake_session, monkeypatch):
+    """Test that an expired status triggers a new database ping."""
+    expired = time.monotonic() - health.READINESS_TTL_SECONDS - 1.0
+    monkeypatch.setattr(health, "_last_db_check", (expired, "disconnected"))
+
+    response = await client.get("/health/ready")
+
+    assert response.json()["database"] == "connected"
+    assert fake_session.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_readiness_check_caches_failure(client, fake_session):
+    """Test that a failed ping reports degraded and is cached."""
+    fake_session.fail = True
+
+    first = await client.get("/health/ready")
+    second = await client.get("/health/ready")
+
+    assert first.status_code == 200
+    assert first.json()["status"] == "degraded"
+    assert first.json()["database"] == "disconnected"
+    assert second.json()["database"] == "disconnected"
+    assert fake_session.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_readiness_check_concurrent_probes(client, fake_session):
+    """Test that concurrent probes after expiry share one database ping."""
+    responses = await asyncio.gather(*(client.get("/health/ready") for _ in range(5)))
+
+    assert all(r.status_code == 200 for r in responses)
+    assert all(r.json()["database"] == "connected" for r in responses)
+    assert fake_session.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_readiness_check_reports_outage_after_ttl(client, fake_session, monkeypatch):
+    """Test that a cached connected status turns degraded once it expires."""
+    first = await client.get("/health/ready")
+    assert first.json()["database"] == "connected"
+
+    fake_session.fail = True
+    cached = await client.get("/health/ready")
+    assert cached.json()["database"] == "connected"
+
+    expired = time.monotonic() - health.READINESS_TTL_SECONDS - 1.0
+    monkeypatch.setattr(health, "_last_db_check", (expired, "connected"))
+    response = await client.get("/health/ready")
+
+    assert response.json()["status"] == "degraded"
+    assert response.json()["database"] == "disconnected"
+    assert fake_session.calls == 2